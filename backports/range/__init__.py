@@ -6,5 +6,8 @@ Backport of python3.X range class
 #   and range_iterator, which are prefixed by "py"
 # - If compiled via Cython, there is a Cython-only version of the iterator
 from .pyrange import range
+from .numrange import numrange
+from .timerange import timerange
+from .encoding import compress, decompress
 
-__all__ = ['range']
+__all__ = ['range', 'numrange', 'timerange', 'compress', 'decompress']
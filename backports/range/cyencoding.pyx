@@ -0,0 +1,60 @@
+from libc.limits cimport LLONG_MAX, LLONG_MIN
+
+from .pyrange import range
+
+
+cdef inline bint _follows(long long last, long long step, long long value):
+    # whether value == last + step, without overflowing C long long
+    if step > 0:
+        return last <= LLONG_MAX - step and value == last + step
+    return last >= LLONG_MIN - step and value == last + step
+
+
+cdef inline bint _distance_fits(long long last, long long value):
+    # whether value - last fits into C long long
+    if value >= 0:
+        return last >= 0 or value <= LLONG_MAX + last
+    return last < 0 or value >= LLONG_MIN + last
+
+
+def compress_buffer(const long long[:] values):
+    """Encode a buffer of C ``long long`` integers as ranges, see :py:func:`~.encoding.compress`"""
+    # acquire the buffer eagerly so that unsuitable values are rejected right away
+    return _compress_buffer(values)
+
+
+def _compress_buffer(const long long[:] values):
+    cdef:
+        Py_ssize_t idx
+        long long start, last, value
+        long long step = 1
+        # the step of two values may exceed C long long - such runs cannot be extended
+        bint wide = False
+        Py_ssize_t count = 1
+    if values.shape[0] == 0:
+        return
+    start = last = values[0]
+    for idx in range(1, values.shape[0]):
+        value = values[idx]
+        if count == 1:
+            if value != last:
+                wide = not _distance_fits(last, value)
+                if not wide:
+                    step = value - last
+                count, last = 2, value
+                continue
+        elif not wide and _follows(last, step, value):
+            count, last = count + 1, value
+            continue
+        yield _run(start, last, step, wide)
+        start = last = value
+        step, count, wide = 1, 1, False
+    yield _run(start, last, step, wide)
+
+
+cdef object _run(long long start, long long last, long long step, bint wide):
+    # range of a run from start to last, inclusive
+    if wide:
+        py_step = <object>last - start
+        return range(start, last + py_step, py_step)
+    return range(start, <object>last + step, step)
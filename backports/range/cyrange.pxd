@@ -8,3 +8,4 @@ cdef class range(object):
     cdef readonly bint _bool
 
     cpdef __py_eq__(self, other)
+    cdef object _position(self, value, bint before)
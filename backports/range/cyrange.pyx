@@ -343,6 +343,109 @@ cdef class range(object):
         # take the slow path, compare every single item
         return sum(1 for self_item in self if self_item == value)
 
+    # Locating arbitrary values
+    # See pyrange.range for the formulas
+    cdef object _position(self, value, bint before):
+        # Position of the python integer ``value`` as per searchsorted
+        # before=True => side='left', before=False => side='right'
+        cdef range_bound c_value
+        cdef range_bound position
+        try:
+            c_value = value
+            with cython.overflowcheck(True):
+                if before:
+                    c_value -= 1 if self.step > 0 else -1
+                position = (c_value - self.start) // self.step + 1
+        except OverflowError:
+            # value is outside of C long long, use python integers
+            if before:
+                value -= 1 if self.step > 0 else -1
+            py_position = (value - self.start) // self.step + 1
+            return 0 if py_position < 0 else self._len if py_position > self._len else py_position
+        return 0 if position < 0 else self._len if position > self._len else position
+
+    def searchsorted(self, value, side='left'):
+        """
+        Return the position at which ``value`` would be inserted to preserve order
+
+        With ``side='left'``, this is the number of elements that precede ``value``;
+        with ``side='right'``, it also counts an element equal to ``value``.
+        For a negative *step*, elements precede ``value`` if they are *larger* than ``value``.
+        """
+        return self._position(index(value), _before_side(side))
+
+    def searchsorted_many(self, values, side='left', out=None):
+        """
+        Return the :py:meth:`searchsorted` position of every item of ``values``
+
+        Positions are written to ``out`` if it is given, and returned as a :py:class:`list` otherwise.
+        """
+        cdef:
+            bint before = _before_side(side)
+            const long long[:] value_buffer
+            long long[:] out_buffer
+            Py_ssize_t idx
+        try:
+            value_buffer = values
+        except (TypeError, ValueError, BufferError):
+            positions = [self._position(index(value), before) for value in values]
+        else:
+            if out is not None:
+                try:
+                    out_buffer = out
+                except (TypeError, ValueError, BufferError):
+                    pass
+                else:
+                    for idx in range(value_buffer.shape[0]):
+                        out_buffer[idx] = self._position(value_buffer[idx], before)
+                    return out
+            positions = [self._position(value_buffer[idx], before) for idx in range(value_buffer.shape[0])]
+        if out is None:
+            return positions
+        for idx, position in enumerate(positions):
+            out[idx] = position
+        return out
+
+    def floor(self, value):
+        """Return the largest element not greater than ``value``. Raises :py:exc:`ValueError` if there is none."""
+        if self.step > 0:
+            position = self._position(index(value), False) - 1
+        else:
+            position = self._position(index(value), True)
+        if 0 <= position < self._len:
+            return self.start + self.step * position
+        raise ValueError('no element of %r is less than or equal to %r' % (self, value))
+
+    def ceil(self, value):
+        """Return the smallest element not less than ``value``. Raises :py:exc:`ValueError` if there is none."""
+        if self.step > 0:
+            position = self._position(index(value), True)
+        else:
+            position = self._position(index(value), False) - 1
+        if 0 <= position < self._len:
+            return self.start + self.step * position
+        raise ValueError('no element of %r is greater than or equal to %r' % (self, value))
+
+    def nearest(self, value):
+        """Return the element closest to ``value``, preferring the smaller one on ties"""
+        if not self._len:
+            raise ValueError('%r has no elements' % (self,))
+        # remainder has the sign of step, so r[position] is at or before value
+        position, remainder = divmod(index(value) - self.start, self.step)
+        distance, step_size = 2 * abs(remainder), abs(self.step)
+        if distance > step_size or (distance == step_size and self.step < 0):
+            position += 1
+        position = 0 if position < 0 else self._len - 1 if position >= self._len else position
+        return self.start + self.step * position
+
+    def count_between(self, low, high):
+        """Return the number of elements ``value`` for which ``low <= value < high``"""
+        if self.step > 0:
+            count = self._position(index(high), True) - self._position(index(low), True)
+        else:
+            count = self._position(index(low), False) - self._position(index(high), False)
+        return count if count > 0 else 0
+
     def __hash__(self):
         # Hash should signify the same sequence of values
         # We hash a tuple of values that define the range.
@@ -366,6 +469,14 @@ cdef class range(object):
         # unpickle: factory(*(factory_args))
         return type(self), (self.start, self.stop, self.step), None, None, None
 
+cdef bint _before_side(side) except -1:
+    # translate searchsorted's ``side`` to whether to exclude equal elements
+    if side == 'left':
+        return True
+    elif side == 'right':
+        return False
+    raise ValueError("side must be 'left' or 'right', not %r" % (side,))
+
 # register at ABCs
 # do not use decorators to play nice with Cython
 _abc.Sequence.register(range)
@@ -0,0 +1,73 @@
+"""Encoding of integer sequences as sequences of ranges"""
+from operator import index
+import itertools
+
+from .pyrange import range
+try:
+    from .cyencoding import compress_buffer
+except ImportError:
+    compress_buffer = None
+
+
+def compress(values):
+    """
+    Encode a sequence of integers as ranges
+
+    :param values: iterable of integers, or buffer of C ``long long``
+    :return: iterator of :py:class:`~backports.range.range` objects
+
+    Consecutive integers are greedily joined into a :py:class:`~backports.range.range`
+    as long as they have the same distance. Runs of a single integer are encoded as
+    one-element ranges, and repeated integers start a new range.
+    The ``values`` are consumed lazily, so that ``compress`` works in bounded memory
+    for arbitrarily long streams.
+
+    .. code:: python
+
+        >>> list(compress([1, 2, 3, 4, 10, 20, 30, 31]))
+        [range(1, 5), range(10, 40, 10), range(31, 32)]
+
+    Sequences that are unions of progressions compress extremely well,
+    while random sequences may not compress at all.
+    """
+    if compress_buffer is not None:
+        try:
+            return compress_buffer(values)
+        except (TypeError, ValueError, BufferError):
+            pass
+    return _compress_iterable(values)
+
+
+def _compress_iterable(values):
+    values = iter(values)
+    for first in values:
+        start = last = index(first)
+        break
+    else:
+        return
+    step, count = 1, 1
+    for value in values:
+        value = index(value)
+        if count == 1:
+            if value != last:
+                step, count, last = value - last, 2, value
+                continue
+        elif value - last == step:
+            count, last = count + 1, value
+            continue
+        yield range(start, last + step, step)
+        start = last = value
+        step, count = 1, 1
+    yield range(start, last + step, step)
+
+
+def decompress(ranges):
+    """
+    Decode a sequence of ranges to the integers they contain
+
+    :param ranges: iterable of :py:class:`~backports.range.range` objects
+    :return: iterator of integers
+
+    This is the inverse of :py:func:`~.compress`.
+    """
+    return itertools.chain.from_iterable(ranges)
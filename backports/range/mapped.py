@@ -0,0 +1,224 @@
+"""Base class for progressions of non-integer values projected onto a range"""
+from __future__ import division
+import sys
+from fractions import Fraction
+
+import collections as _abc
+
+if sys.version_info < (3,):
+    from itertools import imap as _map
+else:
+    _map = map
+
+
+def _floor(scaled):
+    # largest grid point not greater than scaled
+    if scaled.__class__ is Fraction:
+        return scaled.numerator // scaled.denominator
+    return scaled
+
+
+def _ceil(scaled):
+    # smallest grid point not less than scaled
+    if scaled.__class__ is Fraction:
+        return -(-scaled.numerator // scaled.denominator)
+    return scaled
+
+
+# noinspection PyPep8Naming
+class mapped_range(object):
+    """
+    Lazy sequence of values projected onto an integer :py:class:`~backports.range.range`
+
+    Each value is represented by an integer on a regular grid, and the sequence
+    of values is an integer range on this grid. All features of
+    :py:class:`~backports.range.range` carry over, including constant time
+    membership testing, indexing and slicing.
+
+    Subclasses define the projection by implementing :py:meth:`_scaled` to map
+    values onto the grid, and :py:meth:`_value` and :py:meth:`_distance` to map
+    grid points and grid distances back.
+    """
+    __slots__ = ('_range',)
+
+    def _scaled(self, value):
+        """
+        Position of ``value`` on the grid
+
+        :returns: an :py:class:`int` if ``value`` is on the grid, and a
+                  :py:class:`~fractions.Fraction` if it is between grid points
+        :raises TypeError: if ``value`` cannot be compared to the values
+        """
+        raise NotImplementedError
+
+    def _value(self, integer):
+        """Value at the grid point ``integer``"""
+        raise NotImplementedError
+
+    def _distance(self, integer):
+        """Difference between values ``integer`` grid points apart"""
+        return self._value(integer)
+
+    def _derive(self, int_range):
+        """Create a sequence for another ``int_range`` on the same grid"""
+        raise NotImplementedError
+
+    def _on_grid(self, value):
+        # grid point of value, or None if value is not on the grid or not comparable
+        try:
+            scaled = self._scaled(value)
+        except (TypeError, ValueError):
+            return None
+        if scaled.__class__ is Fraction:
+            return scaled.numerator if scaled.denominator == 1 else None
+        return scaled
+
+    # attributes are read-only
+    @property
+    def start(self):
+        """The value of the *start* parameter"""
+        return self._value(self._range.start)
+
+    @property
+    def stop(self):
+        """The value of the *stop* parameter"""
+        return self._value(self._range.stop)
+
+    @property
+    def step(self):
+        """The value of the *step* parameter"""
+        return self._distance(self._range.step)
+
+    def __nonzero__(self):
+        return bool(self._range)
+
+    __bool__ = __nonzero__
+
+    def __len__(self):
+        return len(self._range)
+
+    def __getitem__(self, item):
+        if item.__class__ is slice:
+            return self._derive(self._range[item])
+        return self._value(self._range[item])
+
+    def __iter__(self):
+        return _map(self._value, self._range)
+
+    def __reversed__(self):
+        return _map(self._value, reversed(self._range))
+
+    def __contains__(self, item):
+        integer = self._on_grid(item)
+        return integer is not None and integer in self._range
+
+    def index(self, value, start=None, stop=None):
+        """Return first index of ``value``. Raises :py:exc:`ValueError` if ``value`` is not in the sequence."""
+        integer = self._on_grid(value)
+        if integer is not None:
+            try:
+                return self._range.index(integer, start, stop)
+            except ValueError:
+                pass
+        raise ValueError('%r is not in %s' % (value, self.__class__.__name__))
+
+    def count(self, value):
+        """Return number of occurrences of ``value``"""
+        return int(value in self)
+
+    # Locating arbitrary values
+    def searchsorted(self, value, side='left'):
+        """
+        Return the position at which ``value`` would be inserted to preserve order
+
+        See :py:meth:`backports.range.range.searchsorted` for details.
+        """
+        scaled = self._scaled(value)
+        if scaled.__class__ is not Fraction:
+            return self._range.searchsorted(scaled, side)
+        elif scaled.denominator == 1:
+            return self._range.searchsorted(scaled.numerator, side)
+        elif side not in ('left', 'right'):
+            raise ValueError("side must be 'left' or 'right', not %r" % (side,))
+        # between grid points, both sides are equal to the side of the next grid point
+        if self._range.step > 0:
+            return self._range.searchsorted(_floor(scaled), 'right')
+        return self._range.searchsorted(_ceil(scaled), 'right')
+
+    def floor(self, value):
+        """Return the largest element not greater than ``value``. Raises :py:exc:`ValueError` if there is none."""
+        scaled = self._scaled(value)
+        try:
+            return self._value(self._range.floor(_floor(scaled)))
+        except ValueError:
+            raise ValueError('no element of %r is less than or equal to %r' % (self, value))
+
+    def ceil(self, value):
+        """Return the smallest element not less than ``value``. Raises :py:exc:`ValueError` if there is none."""
+        scaled = self._scaled(value)
+        try:
+            return self._value(self._range.ceil(_ceil(scaled)))
+        except ValueError:
+            raise ValueError('no element of %r is greater than or equal to %r' % (self, value))
+
+    def nearest(self, value):
+        """Return the element closest to ``value``, preferring the smaller one on ties"""
+        scaled = self._scaled(value)
+        if scaled.__class__ is not Fraction or scaled.denominator == 1:
+            return self._value(self._range.nearest(int(scaled)))
+        if not self._range:
+            raise ValueError('%r has no elements' % (self,))
+        # between grid points, the nearest element is nearest to either neighbour
+        candidates = []
+        for locate, neighbour in ((self._range.floor, _floor(scaled)), (self._range.ceil, _ceil(scaled))):
+            try:
+                candidates.append(locate(neighbour))
+            except ValueError:
+                pass
+        return self._value(min(candidates, key=lambda integer: (abs(integer - scaled), integer)))
+
+    def count_between(self, low, high):
+        """Return the number of elements ``value`` for which ``low <= value < high``"""
+        if self._range.step > 0:
+            count = self.searchsorted(high, 'left') - self.searchsorted(low, 'left')
+        else:
+            count = self.searchsorted(low, 'right') - self.searchsorted(high, 'right')
+        return count if count > 0 else 0
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, mapped_range):
+            # same sequence of values if first element and distance between elements match
+            # NOTE: use _len to avoid OverflowError, see range.__len__
+            if self._range._len != other._range._len:
+                return False
+            elif not self._range._len:
+                return True
+            elif self[0] != other[0]:
+                return False
+            return self._range._len == 1 or self[1] == other[1]
+        return NotImplemented
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        # Hash should signify the same sequence of values, see range.__hash__
+        my_len = self._range._len
+        if not my_len:
+            return hash((0, None, None))
+        elif my_len == 1:
+            return hash((1, self[0], None))
+        return hash((my_len, self[0], self[1] - self[0]))
+
+    def __repr__(self):
+        return '%s(%r, %r, %r)' % (self.__class__.__name__, self.start, self.stop, self.step)
+
+    # Pickling
+    def __reduce__(self):
+        return self.__class__, (self.start, self.stop, self.step), None, None, None
+
+# register at ABCs
+# do not use decorators to play nice with Cython
+_abc.Sequence.register(mapped_range)
@@ -0,0 +1,109 @@
+"""Exact progressions of fractional numbers"""
+from __future__ import division
+import math
+from decimal import Decimal
+from fractions import Fraction
+from numbers import Integral, Rational
+
+from .pyrange import range
+from .mapped import mapped_range
+
+
+def _gcd(a, b):
+    while b:
+        a, b = b, a % b
+    return a
+
+
+def _as_fraction(value):
+    """Exact value of a number, using the shortest representation of floats"""
+    if isinstance(value, float):
+        if math.isinf(value) or math.isnan(value):
+            raise ValueError('numrange values must be finite, not %r' % value)
+        return Fraction(Decimal(repr(value)))
+    elif isinstance(value, Decimal):
+        if not value.is_finite():
+            raise ValueError('numrange values must be finite, not %r' % value)
+        return Fraction(value)
+    elif isinstance(value, Rational):
+        return Fraction(value)
+    raise TypeError('numrange values must be rational, decimal or float, not %r' % value.__class__.__name__)
+
+
+def _value_type(values):
+    """Type of the values produced for arguments ``values``"""
+    types = set()
+    for value in values:
+        if isinstance(value, float):
+            types.add(float)
+        elif isinstance(value, Decimal):
+            types.add(Decimal)
+        elif not isinstance(value, Integral):
+            types.add(Fraction)
+    if len(types) > 1:
+        raise TypeError('numrange cannot mix %s values' % ' and '.join(sorted(kind.__name__ for kind in types)))
+    return types.pop() if types else Fraction
+
+
+# noinspection PyPep8Naming
+class numrange(mapped_range):
+    """
+    Object that produces an exact sequence of numbers from start (inclusive) to
+    stop (exclusive) by step.
+
+    The arguments may be :py:class:`~fractions.Fraction`, :py:class:`~decimal.Decimal`
+    or :py:class:`float` values, mixed with integers.
+    The type of arguments also determines the type of values: :py:class:`~fractions.Fraction`
+    for rational or integer arguments, :py:class:`~decimal.Decimal` for decimal arguments and
+    :py:class:`float` for float arguments.
+    Floats are taken by their shortest representation, i.e. ``0.1`` is exactly *one tenth*.
+
+    Values are represented by integers on a grid of the least common denominator of
+    the arguments. Each value is computed from a single integer, so there is no
+    accumulation of rounding errors:
+
+       >>> list(numrange(0, 1, 0.1))
+       [0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9]
+       >>> 0.3 in numrange(0, 1, 0.1)
+       True
+
+    Like :py:class:`~backports.range.range`, this is a lazy sequence with
+    constant time length, indexing, slicing, membership testing and lookup.
+    """
+    __slots__ = ('_type', '_scale', '_digits')
+
+    def __init__(self, start_stop, stop=None, step=None):
+        if stop is None:
+            start_stop, stop = 0, start_stop
+        if step is None:
+            step = 1
+        self._type = _value_type((start_stop, stop, step))
+        bounds = _as_fraction(start_stop), _as_fraction(stop), _as_fraction(step)
+        scale = 1
+        for bound in bounds:
+            scale = scale // _gcd(scale, bound.denominator) * bound.denominator
+        self._digits = 0
+        if self._type is not Fraction:
+            # decimal values require a grid of 10 ** digits
+            while 10 ** self._digits % scale:
+                self._digits += 1
+            scale = 10 ** self._digits
+        self._scale = scale
+        self._range = range(*[int(bound * scale) for bound in bounds])
+
+    def _scaled(self, value):
+        scaled = _as_fraction(value) * self._scale
+        return scaled.numerator if scaled.denominator == 1 else scaled
+
+    def _value(self, integer):
+        if self._type is Fraction:
+            return Fraction(integer, self._scale)
+        elif self._type is Decimal:
+            return Decimal('%dE-%d' % (integer, self._digits))
+        return integer / self._scale
+
+    def _derive(self, int_range):
+        derived = object.__new__(self.__class__)
+        derived._type, derived._scale, derived._digits = self._type, self._scale, self._digits
+        derived._range = int_range
+        return derived
@@ -352,6 +352,92 @@ class range(object):
         # take the slow path, compare every single item
         return sum(1 for self_item in self if self_item == value)
 
+    # Locating arbitrary values
+    # All positions are derived from the index formula ``r[i] = start + step*i``:
+    # the number of elements at or before ``value`` (in the order of the range)
+    # is ``(value - start) // step + 1``, clamped to ``[0, len]``.
+    # Elements strictly before ``value`` are those at or before the preceding
+    # integer, which is ``value - 1`` for ascending and ``value + 1`` for
+    # descending ranges.
+    def searchsorted(self, value, side='left'):
+        """
+        Return the position at which ``value`` would be inserted to preserve order
+
+        With ``side='left'``, this is the number of elements that precede ``value``;
+        with ``side='right'``, it also counts an element equal to ``value``.
+        For a negative *step*, elements precede ``value`` if they are *larger* than ``value``.
+        """
+        value = index(value)
+        if side == 'left':
+            value -= 1 if self._step > 0 else -1
+        elif side != 'right':
+            raise ValueError("side must be 'left' or 'right', not %r" % (side,))
+        position = (value - self._start) // self._step + 1
+        return 0 if position < 0 else self._len if position > self._len else position
+
+    def searchsorted_many(self, values, side='left', out=None):
+        """
+        Return the :py:meth:`searchsorted` position of every item of ``values``
+
+        Positions are written to ``out`` if it is given, and returned as a :py:class:`list` otherwise.
+        """
+        if side == 'left':
+            shift = 1 if self._step > 0 else -1
+        elif side == 'right':
+            shift = 0
+        else:
+            raise ValueError("side must be 'left' or 'right', not %r" % (side,))
+        start, step, length = self._start + shift, self._step, self._len
+        positions = []
+        for value in values:
+            position = (index(value) - start) // step + 1
+            positions.append(0 if position < 0 else length if position > length else position)
+        if out is None:
+            return positions
+        for idx, position in enumerate(positions):
+            out[idx] = position
+        return out
+
+    def floor(self, value):
+        """Return the largest element not greater than ``value``. Raises :py:exc:`ValueError` if there is none."""
+        if self._step > 0:
+            position = self.searchsorted(value, 'right') - 1
+        else:
+            position = self.searchsorted(value, 'left')
+        if 0 <= position < self._len:
+            return self._start + self._step * position
+        raise ValueError('no element of %r is less than or equal to %r' % (self, value))
+
+    def ceil(self, value):
+        """Return the smallest element not less than ``value``. Raises :py:exc:`ValueError` if there is none."""
+        if self._step > 0:
+            position = self.searchsorted(value, 'left')
+        else:
+            position = self.searchsorted(value, 'right') - 1
+        if 0 <= position < self._len:
+            return self._start + self._step * position
+        raise ValueError('no element of %r is greater than or equal to %r' % (self, value))
+
+    def nearest(self, value):
+        """Return the element closest to ``value``, preferring the smaller one on ties"""
+        if not self._len:
+            raise ValueError('%r has no elements' % (self,))
+        # remainder has the sign of step, so r[position] is at or before value
+        position, remainder = divmod(index(value) - self._start, self._step)
+        distance, step_size = 2 * abs(remainder), abs(self._step)
+        if distance > step_size or (distance == step_size and self._step < 0):
+            position += 1
+        position = 0 if position < 0 else self._len - 1 if position >= self._len else position
+        return self._start + self._step * position
+
+    def count_between(self, low, high):
+        """Return the number of elements ``value`` for which ``low <= value < high``"""
+        if self._step > 0:
+            count = self.searchsorted(high, 'left') - self.searchsorted(low, 'left')
+        else:
+            count = self.searchsorted(low, 'right') - self.searchsorted(high, 'right')
+        return count if count > 0 else 0
+
     def __hash__(self):
         # Hash should signify the same sequence of values
         # We hash a tuple of values that define the range.
@@ -0,0 +1,102 @@
+"""Progressions of dates, times and durations"""
+from datetime import date, datetime, timedelta, tzinfo
+
+from .pyrange import range
+from .mapped import mapped_range
+
+try:
+    from datetime import timezone
+except ImportError:  # pragma: no cover
+    class _UTCZone(tzinfo):
+        """The UTC timezone, for python versions without :py:class:`datetime.timezone`"""
+        def utcoffset(self, dt):
+            return timedelta(0)
+
+        def dst(self, dt):
+            return timedelta(0)
+
+        def tzname(self, dt):
+            return 'UTC'
+
+    _UTC = _UTCZone()
+else:
+    _UTC = timezone.utc
+
+
+def _ticks(delta):
+    """Number of microseconds in a :py:class:`~datetime.timedelta`"""
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+# noinspection PyPep8Naming
+class timerange(mapped_range):
+    """
+    Object that produces a sequence of points in time from start (inclusive) to
+    stop (exclusive) by step.
+
+    The *start* and *stop* arguments must both be :py:class:`~datetime.datetime`,
+    :py:class:`~datetime.date` or :py:class:`~datetime.timedelta` objects,
+    and *step* must be a :py:class:`~datetime.timedelta`.
+    For :py:class:`~datetime.date` objects, *step* must be a multiple of one day.
+
+    Values are represented by integer microseconds since *start*.
+    Like :py:class:`~backports.range.range`, this is a lazy sequence with
+    constant time length, indexing, slicing, membership testing and lookup:
+
+       >>> ticks = timerange(datetime(2017, 1, 1), datetime(2017, 1, 2), timedelta(minutes=15))
+       >>> len(ticks)
+       96
+       >>> datetime(2017, 1, 1, 13, 45) in ticks
+       True
+       >>> ticks.index(datetime(2017, 1, 1, 13, 45))
+       55
+       >>> ticks.floor(datetime(2017, 1, 1, 13, 52))
+       datetime.datetime(2017, 1, 1, 13, 45)
+
+    Timezone aware :py:class:`~datetime.datetime` objects are stepped in absolute time,
+    not in wall time: ``step`` is the actual time passing between values, even across
+    changes of the UTC offset. Values are expressed in the timezone of ``start``.
+    Aware and naive objects cannot be mixed, and naive values are never
+    contained in an aware range or vice versa.
+    """
+    __slots__ = ('_type', '_origin', '_tzinfo')
+
+    def __init__(self, start, stop, step):
+        if isinstance(start, datetime):
+            self._type = datetime
+        elif isinstance(start, date):
+            self._type = date
+        elif isinstance(start, timedelta):
+            self._type = timedelta
+        else:
+            raise TypeError('timerange start must be a datetime, date or timedelta, not %r' % type(start).__name__)
+        if not isinstance(step, timedelta):
+            raise TypeError('timerange step must be a timedelta, not %r' % type(step).__name__)
+        self._tzinfo = start.tzinfo if self._type is datetime and start.utcoffset() is not None else None
+        # aware values are measured against UTC, so that the offset of each value applies
+        self._origin = start if self._tzinfo is None else start.astimezone(_UTC)
+        step_ticks = _ticks(step)
+        if self._type is date and step_ticks % 86400000000:
+            raise ValueError('timerange step must be a multiple of one day for dates, not %r' % step)
+        self._range = range(0, self._scaled(stop), step_ticks)
+
+    def _scaled(self, value):
+        # date is the base class of datetime, but the types do not mix
+        if not isinstance(value, self._type) or (self._type is date and isinstance(value, datetime)):
+            raise TypeError('timerange of %s cannot contain %r' % (self._type.__name__, type(value).__name__))
+        # raises TypeError on mixing naive and aware datetimes
+        return _ticks(value - self._origin)
+
+    def _value(self, integer):
+        if self._tzinfo is None:
+            return self._origin + timedelta(microseconds=integer)
+        return (self._origin + timedelta(microseconds=integer)).astimezone(self._tzinfo)
+
+    def _distance(self, integer):
+        return timedelta(microseconds=integer)
+
+    def _derive(self, int_range):
+        derived = object.__new__(self.__class__)
+        derived._type, derived._origin, derived._tzinfo = self._type, self._origin, self._tzinfo
+        derived._range = int_range
+        return derived
@@ -0,0 +1,66 @@
+from __future__ import print_function
+import array
+import itertools
+import random
+
+from backports.range import compress, decompress, range as backport_range
+
+# Backports of testing infrastructure
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+
+class EncodingTest(unittest.TestCase):
+    """Encoding integer sequences as ranges"""
+    sequences = (
+        [], [1], [1, 1], [1, 2], [5, 3], list(range(100)), list(range(100, 0, -3)),
+        [1, 2, 3, 4, 10, 20, 30, 31], [0, 0, 0, 1, 1, 2], [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5],
+        list(itertools.chain(range(0, 50, 2), range(50, 100), range(100, 200, 7), range(200, 100, -1))),
+        [-2**63, 2**63 - 1, 0, -2**63, 2**63 - 2, 2**63 - 1], [2**63 - 2, 2**63 - 1, 2**63, 2**63 + 1],
+        [-2**63 + 2, -2**63 + 1, -2**63, -2**63 - 1, 5],
+    )
+
+    def assert_encoding(self, values, encoded):
+        self.assertEqual(list(decompress(encoded)), list(values))
+        for run in encoded:
+            self.assertIsInstance(run, backport_range)
+            self.assertTrue(run)
+
+    def test_roundtrip(self):
+        for values in self.sequences:
+            with self.subTest(values=values):
+                self.assert_encoding(values, list(compress(values)))
+                self.assert_encoding(values, list(compress(iter(values))))
+                if all(-2**63 <= value < 2**63 for value in values):
+                    self.assert_encoding(values, list(compress(array.array('q', values))))
+
+    def test_random(self):
+        for _ in range(20):
+            values = [random.randint(-10, 10) for _ in range(random.randint(0, 100))]
+            self.assert_encoding(values, list(compress(values)))
+            self.assert_encoding(values, list(compress(array.array('q', values))))
+
+    def test_greedy(self):
+        self.assertEqual(
+            list(compress([1, 2, 3, 4, 10, 20, 30, 31])),
+            [backport_range(1, 5), backport_range(10, 40, 10), backport_range(31, 32)]
+        )
+        self.assertEqual(list(compress(range(1000))), [backport_range(1000)])
+        self.assertEqual(list(compress(array.array('q', range(1000, 0, -5)))), [backport_range(1000, 0, -5)])
+        progressions = [backport_range(0, 500, 2), backport_range(501, 1000), backport_range(1010, 4000, 3)]
+        self.assertEqual(list(compress(decompress(progressions))), progressions)
+
+    def test_stream(self):
+        """Values are consumed lazily"""
+        runs = compress(itertools.count())
+        self.assertEqual(next(runs)[:10], backport_range(10))
+        runs = compress(itertools.chain.from_iterable(range(start, start + 3) for start in itertools.count(0, 5)))
+        self.assertEqual(list(itertools.islice(runs, 3)), [backport_range(0, 3), backport_range(5, 8), backport_range(10, 13)])
+
+    def test_types(self):
+        with self.assertRaises(TypeError):
+            list(compress([1, 2.0]))
+        with self.assertRaises(TypeError):
+            list(compress(['1']))
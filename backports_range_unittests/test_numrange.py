@@ -0,0 +1,151 @@
+from __future__ import print_function
+import itertools
+import pickle
+from decimal import Decimal
+from fractions import Fraction
+
+from backports.range import numrange
+
+# Backports of testing infrastructure
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+
+def exact_values(start, stop, step):
+    """Reference sequence of exact fractions from start to stop by step"""
+    start, stop, step = Fraction(start), Fraction(stop), Fraction(step)
+    values = []
+    while (start < stop) if step > 0 else (start > stop):
+        values.append(start)
+        start += step
+    return values
+
+
+class NumRangeTest(unittest.TestCase):
+    """Progressions of fractional numbers"""
+    init_args = (
+        (Fraction(1, 3),), (0, 1, Fraction(1, 3)), (Fraction(-7, 4), Fraction(5, 6), Fraction(1, 12)),
+        (Fraction(5, 6), Fraction(-7, 4), Fraction(-1, 4)), (Decimal('0.5'), Decimal('2'), Decimal('0.25')),
+        (Decimal('-1.125'), 3, Decimal('0.5')), (Decimal('1'), Decimal('-1'), Decimal('-0.1')),
+        (1, 1, Fraction(1, 2)), (0, Decimal('-1'), Decimal('0.1')),
+    )
+
+    def test_values(self):
+        for args in self.init_args:
+            with self.subTest(args=args):
+                expected = exact_values(*args) if len(args) == 3 else exact_values(0, args[0], 1)
+                test_range = numrange(*args)
+                self.assertEqual(len(test_range), len(expected))
+                self.assertEqual(list(test_range), expected)
+                self.assertEqual(list(reversed(test_range)), expected[::-1])
+                self.assertEqual(bool(test_range), bool(expected))
+                for idx in itertools.chain(range(len(expected)), range(-len(expected), 0)):
+                    self.assertEqual(test_range[idx], expected[idx])
+                    self.assertIn(expected[idx], test_range)
+                    self.assertEqual(test_range.index(expected[idx]), expected.index(expected[idx]))
+                    self.assertEqual(test_range.count(expected[idx]), 1)
+                with self.assertRaises(IndexError):
+                    test_range[len(expected)]
+
+    def test_value_types(self):
+        self.assertEqual({type(value) for value in numrange(0, 1, Fraction(1, 4))}, {Fraction})
+        self.assertEqual({type(value) for value in numrange(0, 1, Decimal('0.25'))}, {Decimal})
+        self.assertEqual({type(value) for value in numrange(0, 1, 0.25)}, {float})
+        self.assertEqual(numrange(0, 1, Decimal('0.25'))[1], Decimal('0.25'))
+        self.assertEqual(str(numrange(0, 1, Decimal('0.25'))[2]), '0.50')
+        with self.assertRaises(TypeError):
+            numrange(0, Decimal(1), Fraction(1, 3))
+        with self.assertRaises(TypeError):
+            numrange(0, 1.0, Decimal('0.1'))
+        with self.assertRaises(TypeError):
+            numrange(0, '1', 1)
+        with self.assertRaises(ValueError):
+            numrange(0, float('inf'), 1.0)
+        with self.assertRaises(ValueError):
+            numrange(0, 1, Fraction(0))
+
+    def test_float_drift(self):
+        """Float progressions do not accumulate errors"""
+        test_range = numrange(0, 100, 0.1)
+        self.assertEqual(len(test_range), 1000)
+        self.assertEqual(test_range[3], 0.3)
+        self.assertEqual(test_range[-1], 99.9)
+        self.assertIn(0.3, test_range)
+        self.assertNotIn(0.1 + 0.2, test_range)
+        self.assertEqual(test_range.index(12.3), 123)
+        self.assertEqual(list(test_range), [value / 10 for value in range(1000)])
+
+    def test_contains(self):
+        test_range = numrange(0, 2, Fraction(1, 3))
+        for value in (Fraction(1, 3), 1, Fraction(5, 3), True, Decimal('1'), 1.0):
+            self.assertIn(value, test_range)
+        for value in (Fraction(1, 2), 2, -1, Fraction(1, 6), Decimal('0.5'), 0.5, 'a', None, float('nan')):
+            self.assertNotIn(value, test_range)
+            with self.assertRaises(ValueError):
+                test_range.index(value)
+            self.assertEqual(test_range.count(value), 0)
+
+    def test_slice(self):
+        for args in self.init_args:
+            test_range = numrange(*args)
+            expected = list(test_range)
+            for start, stop, step in itertools.product((None, 0, 1, -1, 3), (None, 0, 2, -2, 10), (None, 1, 2, -1, -3)):
+                with self.subTest(args=args, slice=(start, stop, step)):
+                    self.assertEqual(list(test_range[start:stop:step]), expected[start:stop:step])
+
+    def test_compare_hash(self):
+        self.assertEqual(numrange(0, 1, Fraction(1, 2)), numrange(0, Fraction(3, 4), Fraction(1, 2)))
+        self.assertEqual(numrange(0, 1, Fraction(1, 2)), numrange(0, 1, Decimal('0.5')))
+        self.assertEqual(numrange(0, 1, Fraction(1, 2)), numrange(0, 1, 0.5))
+        self.assertEqual(numrange(2, 1, 1), numrange(0))
+        self.assertNotEqual(numrange(0, 1, Fraction(1, 2)), numrange(0, 1, Fraction(1, 3)))
+        self.assertNotEqual(numrange(0, 1, Fraction(1, 2)), numrange(Fraction(1, 2), 1, Fraction(1, 2)))
+        self.assertNotEqual(numrange(0, 1, Fraction(1, 2)), [0, Fraction(1, 2)])
+        for args_a, args_b in itertools.product(self.init_args, repeat=2):
+            if numrange(*args_a) == numrange(*args_b):
+                self.assertEqual(hash(numrange(*args_a)), hash(numrange(*args_b)))
+        self.assertEqual(hash(numrange(0, 1, Fraction(1, 2))), hash(numrange(0, 1, Decimal('0.5'))))
+
+    def test_pickle(self):
+        for args in self.init_args:
+            test_range = numrange(*args)
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(args=args, proto=proto):
+                    restored = pickle.loads(pickle.dumps(test_range, proto))
+                    self.assertEqual(restored, test_range)
+                    self.assertEqual(list(restored), list(test_range))
+
+    def test_searchsorted(self):
+        for args in self.init_args:
+            test_range = numrange(*args)
+            values = list(test_range)
+            probes = [Fraction(numerator, 24) for numerator in range(-72, 73)]
+            for probe in probes:
+                with self.subTest(args=args, probe=probe):
+                    if test_range.step > 0:
+                        left = sum(1 for value in values if value < probe)
+                        right = sum(1 for value in values if value <= probe)
+                    else:
+                        left = sum(1 for value in values if value > probe)
+                        right = sum(1 for value in values if value >= probe)
+                    self.assertEqual(test_range.searchsorted(probe), left)
+                    self.assertEqual(test_range.searchsorted(probe, 'right'), right)
+                    below = [value for value in values if value <= probe]
+                    above = [value for value in values if value >= probe]
+                    if below:
+                        self.assertEqual(test_range.floor(probe), max(below))
+                    else:
+                        self.assertRaises(ValueError, test_range.floor, probe)
+                    if above:
+                        self.assertEqual(test_range.ceil(probe), min(above))
+                    else:
+                        self.assertRaises(ValueError, test_range.ceil, probe)
+                    if values:
+                        nearest = min(values, key=lambda value: (abs(Fraction(value) - probe), value))
+                        self.assertEqual(test_range.nearest(probe), nearest)
+            for low, high in itertools.product(probes[::9], probes[::11]):
+                with self.subTest(args=args, low=low, high=high):
+                    expected = sum(1 for value in values if low <= value < high)
+                    self.assertEqual(test_range.count_between(low, high), expected)
@@ -0,0 +1,93 @@
+from __future__ import print_function
+import array
+import bisect
+import itertools
+
+from backports_range_unittests.utility import RANGE_FACTORIES, RANGE_ARGS
+
+# Backports of testing infrastructure
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+
+class SearchSortedTest(unittest.TestCase):
+    """Locating arbitrary values in ranges"""
+    @staticmethod
+    def _probes(range_args):
+        values = range(*range_args)
+        bounds = [values.start, values.stop]
+        return list(itertools.chain.from_iterable(range(bound - 8, bound + 8) for bound in bounds))
+
+    def _ranges(self):
+        for (name, factory), args in itertools.product(RANGE_FACTORIES.items(), RANGE_ARGS):
+            yield name, args, factory(*args), list(range(*args))
+
+    def test_searchsorted(self):
+        for name, args, test_range, values in self._ranges():
+            ordered = values if test_range.step > 0 else [-value for value in values]
+            for probe in self._probes(args):
+                key = probe if test_range.step > 0 else -probe
+                with self.subTest(type=name, range=args, probe=probe):
+                    self.assertEqual(test_range.searchsorted(probe), bisect.bisect_left(ordered, key))
+                    self.assertEqual(test_range.searchsorted(probe, 'left'), bisect.bisect_left(ordered, key))
+                    self.assertEqual(test_range.searchsorted(probe, 'right'), bisect.bisect_right(ordered, key))
+            with self.assertRaises(ValueError):
+                test_range.searchsorted(0, 'middle')
+            with self.assertRaises(TypeError):
+                test_range.searchsorted(1.5)
+
+    def test_searchsorted_many(self):
+        for name, args, test_range, values in self._ranges():
+            probes = self._probes(args)
+            with self.subTest(type=name, range=args):
+                for side in ('left', 'right'):
+                    expected = [test_range.searchsorted(probe, side) for probe in probes]
+                    self.assertEqual(test_range.searchsorted_many(probes, side), expected)
+                    self.assertEqual(test_range.searchsorted_many(iter(probes), side), expected)
+                    if all(-2**63 <= probe < 2**63 for probe in probes):
+                        buffer = array.array('q', probes)
+                        self.assertEqual(test_range.searchsorted_many(buffer, side), expected)
+                        out = array.array('q', [0] * len(probes))
+                        self.assertIs(test_range.searchsorted_many(buffer, side, out=out), out)
+                        self.assertEqual(out.tolist(), expected)
+                        out = [None] * len(probes)
+                        test_range.searchsorted_many(buffer, side, out=out)
+                        self.assertEqual(out, expected)
+
+    def test_floor_ceil(self):
+        for name, args, test_range, values in self._ranges():
+            for probe in self._probes(args):
+                with self.subTest(type=name, range=args, probe=probe):
+                    below = [value for value in values if value <= probe]
+                    above = [value for value in values if value >= probe]
+                    if below:
+                        self.assertEqual(test_range.floor(probe), max(below))
+                    else:
+                        with self.assertRaises(ValueError):
+                            test_range.floor(probe)
+                    if above:
+                        self.assertEqual(test_range.ceil(probe), min(above))
+                    else:
+                        with self.assertRaises(ValueError):
+                            test_range.ceil(probe)
+
+    def test_nearest(self):
+        for name, args, test_range, values in self._ranges():
+            if not values:
+                with self.assertRaises(ValueError):
+                    test_range.nearest(0)
+                continue
+            for probe in self._probes(args):
+                with self.subTest(type=name, range=args, probe=probe):
+                    expected = min(values, key=lambda value: (abs(value - probe), value))
+                    self.assertEqual(test_range.nearest(probe), expected)
+
+    def test_count_between(self):
+        for name, args, test_range, values in self._ranges():
+            probes = self._probes(args)
+            for low, high in itertools.product(probes[::3], probes[1::3]):
+                with self.subTest(type=name, range=args, low=low, high=high):
+                    expected = sum(1 for value in values if low <= value < high)
+                    self.assertEqual(test_range.count_between(low, high), expected)
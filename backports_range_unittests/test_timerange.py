@@ -0,0 +1,148 @@
+from __future__ import print_function
+import itertools
+import pickle
+from datetime import date, datetime, timedelta, tzinfo
+
+from backports.range import timerange
+
+# Backports of testing infrastructure
+try:
+    import unittest2 as unittest
+except ImportError:
+    import unittest
+
+
+class FixedOffset(tzinfo):
+    """Timezone with a fixed offset in minutes"""
+    def __init__(self, minutes):
+        self._minutes = minutes
+        self._offset = timedelta(minutes=minutes)
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def dst(self, dt):
+        return timedelta(0)
+
+    def __reduce__(self):
+        return self.__class__, (self._minutes,)
+
+    def __repr__(self):
+        return '%s(%d)' % (self.__class__.__name__, self._minutes)
+
+
+def reference_values(start, stop, step):
+    """Reference sequence of times from start to stop by step"""
+    values = []
+    while (start < stop) if step > timedelta(0) else (start > stop):
+        values.append(start)
+        start += step
+    return values
+
+
+class TimeRangeTest(unittest.TestCase):
+    """Progressions of points in time"""
+    init_args = (
+        (datetime(2017, 1, 1), datetime(2017, 1, 2), timedelta(minutes=15)),
+        (datetime(2017, 1, 2), datetime(2017, 1, 1), timedelta(minutes=-7, microseconds=3)),
+        (datetime(2017, 1, 1), datetime(2017, 1, 1), timedelta(seconds=1)),
+        (datetime(2017, 1, 1, tzinfo=FixedOffset(60)), datetime(2017, 1, 1, 12, tzinfo=FixedOffset(-120)),
+         timedelta(hours=1, seconds=1)),
+        (date(2016, 2, 1), date(2016, 4, 1), timedelta(days=3)),
+        (date(2016, 4, 1), date(2016, 2, 1), timedelta(days=-7)),
+        (timedelta(hours=-3), timedelta(days=2), timedelta(minutes=45)),
+        (timedelta(0), timedelta(days=999900000), timedelta(days=123456)),
+    )
+
+    def test_values(self):
+        for args in self.init_args:
+            with self.subTest(args=args):
+                expected = reference_values(*args)
+                test_range = timerange(*args)
+                self.assertEqual(len(test_range), len(expected))
+                self.assertEqual(list(test_range), expected)
+                self.assertEqual(list(reversed(test_range)), expected[::-1])
+                self.assertEqual(test_range.step, args[2])
+                for idx in itertools.chain(range(0, len(expected), 7), range(-len(expected), 0, 5)):
+                    self.assertEqual(test_range[idx], expected[idx])
+                    self.assertIn(expected[idx], test_range)
+                    self.assertEqual(test_range.index(expected[idx]), expected.index(expected[idx]))
+                    self.assertNotIn(expected[idx] + timedelta(days=1, microseconds=1), test_range)
+
+    def test_slice(self):
+        for args in self.init_args:
+            test_range = timerange(*args)
+            expected = list(test_range)
+            for start, stop, step in itertools.product((None, 0, 1, -1, 3), (None, 0, 2, -2, 10), (None, 1, 2, -3)):
+                with self.subTest(args=args, slice=(start, stop, step)):
+                    self.assertEqual(list(test_range[start:stop:step]), expected[start:stop:step])
+
+    def test_types(self):
+        with self.assertRaises(TypeError):
+            timerange(1, 2, timedelta(1))
+        with self.assertRaises(TypeError):
+            timerange(datetime(2017, 1, 1), datetime(2017, 1, 2), 1)
+        with self.assertRaises(TypeError):
+            timerange(datetime(2017, 1, 1), date(2017, 1, 2), timedelta(1))
+        with self.assertRaises(TypeError):
+            timerange(datetime(2017, 1, 1), datetime(2017, 1, 2, tzinfo=FixedOffset(0)), timedelta(1))
+        with self.assertRaises(ValueError):
+            timerange(date(2017, 1, 1), date(2017, 1, 2), timedelta(hours=1))
+        with self.assertRaises(ValueError):
+            timerange(date(2017, 1, 1), date(2017, 1, 2), timedelta(0))
+        days = timerange(date(2017, 1, 1), date(2017, 1, 9), timedelta(days=1))
+        self.assertNotIn(datetime(2017, 1, 2), days)
+        self.assertNotIn(timedelta(days=1), days)
+        self.assertNotIn(1, days)
+        self.assertIn(date(2017, 1, 2), days)
+
+    def test_timezone(self):
+        """Aware ranges step in absolute time and use the timezone of start"""
+        local, other = FixedOffset(120), FixedOffset(-60)
+        test_range = timerange(
+            datetime(2017, 1, 1, tzinfo=local), datetime(2017, 1, 1, 12, tzinfo=other), timedelta(hours=1)
+        )
+        # 00:00+02:00 to 12:00-01:00 are 15 hours
+        self.assertEqual(len(test_range), 15)
+        self.assertTrue(all(value.tzinfo is local for value in test_range))
+        self.assertIn(datetime(2016, 12, 31, 23, tzinfo=FixedOffset(0)), test_range)
+        self.assertNotIn(datetime(2017, 1, 1, 1), test_range)
+        naive_range = timerange(datetime(2017, 1, 1), datetime(2017, 1, 2), timedelta(hours=1))
+        self.assertNotIn(datetime(2017, 1, 1, 1, tzinfo=local), naive_range)
+        with self.assertRaises(TypeError):
+            naive_range.searchsorted(datetime(2017, 1, 1, 1, tzinfo=local))
+
+    def test_compare_hash_pickle(self):
+        minutes = timerange(datetime(2017, 1, 1), datetime(2017, 1, 2), timedelta(minutes=1))
+        self.assertEqual(minutes, timerange(datetime(2017, 1, 1), datetime(2017, 1, 1, 23, 59, 1), timedelta(minutes=1)))
+        self.assertEqual(hash(minutes), hash(minutes[:]))
+        self.assertNotEqual(minutes, minutes[1:])
+        for args in self.init_args:
+            test_range = timerange(*args)
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                with self.subTest(args=args, proto=proto):
+                    restored = pickle.loads(pickle.dumps(test_range, proto))
+                    self.assertEqual(restored, test_range)
+                    self.assertEqual(list(restored[:10]), list(test_range[:10]))
+
+    def test_searchsorted(self):
+        test_range = timerange(datetime(2017, 1, 1), datetime(2017, 1, 2), timedelta(minutes=15))
+        values = list(test_range)
+        for probe in timerange(datetime(2016, 12, 31, 23), datetime(2017, 1, 2, 1), timedelta(minutes=4)):
+            with self.subTest(probe=probe):
+                self.assertEqual(test_range.searchsorted(probe), sum(1 for value in values if value < probe))
+                self.assertEqual(test_range.searchsorted(probe, 'right'), sum(1 for value in values if value <= probe))
+                below = [value for value in values if value <= probe]
+                above = [value for value in values if value >= probe]
+                if below:
+                    self.assertEqual(test_range.floor(probe), max(below))
+                else:
+                    self.assertRaises(ValueError, test_range.floor, probe)
+                if above:
+                    self.assertEqual(test_range.ceil(probe), min(above))
+                else:
+                    self.assertRaises(ValueError, test_range.ceil, probe)
+                self.assertEqual(
+                    test_range.nearest(probe), min(values, key=lambda value: (abs(value - probe), value))
+                )
+        self.assertEqual(test_range.count_between(datetime(2017, 1, 1, 1), datetime(2017, 1, 1, 2, 1)), 5)
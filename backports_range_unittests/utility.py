@@ -0,0 +1,24 @@
+"""Helpers shared by the unittests"""
+from backports.range import pyrange
+
+
+def pure_range(start_stop, stop=None, step=None):
+    """Construct a pure python range object regardless of cython support"""
+    self = object.__new__(pyrange.range)
+    self.__init__(start_stop, stop, step)
+    return self
+
+
+#: factories of every range implementation available
+RANGE_FACTORIES = {
+    'backport': pyrange.range,
+    'pyrange': pure_range,
+}
+
+#: range arguments covering empty, regular, negative and C long long exceeding ranges
+RANGE_ARGS = (
+    (0,), (1,), (15,), (-3,),
+    (-50, 50), (1, 120, 5), (1, 119, 5), (-27, 0, 2), (0, -27, -2), (20, -20, -3), (10, 10, -1),
+    (9223372036854775800, 9223372036854775812, 3), (-9223372036854775810, -9223372036854775800, 2),
+    (9223372036854775812, 9223372036854775800, -3),
+)
@@ -22,7 +22,7 @@ except Exception as err:
     print('Cannot cythonize "backports.range": %s' % err, file=sys.stderr)
 else:
     source_base = os.path.join('backports', 'range')
-    for basename in ('cyrange.pyx', 'cyrange_iterator.pyx'):
+    for basename in ('cyrange.pyx', 'cyrange_iterator.pyx', 'cyencoding.pyx'):
         rel_path = os.path.join(source_base, basename)
         for compiled_file in (os.path.splitext(rel_path)[0] + ext for ext in ('.so', '.c')):
             try: